@@ -4,17 +4,64 @@
 import asyncio
 import secrets
 import string
-import re
 import hashlib
 import time
+from contextlib import asynccontextmanager, suppress
+from collections import Counter, OrderedDict, deque
 from typing import Dict, List, Optional
 from fastapi import FastAPI, WebSocket, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
+from fastapi.responses import HTMLResponse, JSONResponse
+from pydantic import BaseModel, ConfigDict
 import uvicorn
-import json
+import orjson
+
+_SYMBOLS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+
+# Table de classes par octet (analyse de force en une passe)
+# 1 = minuscule | 2 = majuscule | 4 = chiffre | 8 = symbole
+# Classes ASCII uniquement : les octets UTF-8 non ASCII (ex. chiffres
+# arabes "٣") ne comptent dans aucune classe, contrairement à l'ancien \d
+_CLASS_LUT = bytes(
+    1 if chr(b) in string.ascii_lowercase else
+    2 if chr(b) in string.ascii_uppercase else
+    4 if chr(b) in string.digits else
+    8 if chr(b) in _SYMBOLS else 0
+    for b in range(256)
+)
+
+def _charset_tables(chars: str):
+    """Tables translate() : octet aléatoire -> caractère, sans biais modulo"""
+    n = len(chars)
+    cutoff = 256 - (256 % n)
+    table = bytes(ord(chars[b % n]) for b in range(256))
+    rejected = bytes(range(cutoff, 256))  # Queue biaisée écartée
+    return table, rejected
+
+# Jeux de caractères précalculés pour les 8 combinaisons d'options
+# clé : (uppercase, numbers, symbols)
+_CHARSETS = {
+    (u, n, s): (string.ascii_lowercase
+                + (string.ascii_uppercase if u else "")
+                + (string.digits if n else "")
+                + (_SYMBOLS if s else ""))
+    for u in (False, True) for n in (False, True) for s in (False, True)
+}
+_CHARSET_TABLES = {key: _charset_tables(chars) for key, chars in _CHARSETS.items()}
+
+def _random_passwords(count, length, symbols, numbers, uppercase):
+    """Génère `count` mots de passe à partir d'une seule lecture d'entropie"""
+    table, rejected = _CHARSET_TABLES[(bool(uppercase), bool(numbers), bool(symbols))]
+    total = count * length
+    
+    raw = b""
+    while len(raw) < total:
+        raw += secrets.token_bytes(total * 2).translate(table, rejected)
+    return [raw[i * length:(i + 1) * length].decode() for i in range(count)]
+
+# Niveau de force indexé par le score (0 à 6)
+_LEVELS = ("weak", "weak", "weak", "medium", "strong", "ultra", "ultra")
 
 # ===============================================
 # ILN ESSENCE IMPLEMENTATIONS
@@ -23,31 +70,53 @@ import json
 class ILNEssences:
     """Implémentation native des essences ILN"""
     
+    _tasks = set()
+    _cache = OrderedDict()
+    _cache_maxsize = 1024
+    
     @staticmethod
     def chan_concurrent(data_stream):
         """Essence chan!() - Traitement concurrent natif"""
-        return asyncio.create_task(data_stream)
+        task = asyncio.create_task(data_stream)
+        # Référence forte : une tâche non attendue ne doit pas être collectée
+        ILNEssences._tasks.add(task)
+        task.add_done_callback(ILNEssences._tasks.discard)
+        return task
     
     @staticmethod
     def own_secure(data, validation_func):
         """Essence own!() - Ownership sécurisé des données"""
         if validation_func(data):
-            return {"owned": True, "data": data, "hash": hashlib.sha256(str(data).encode()).hexdigest()[:8]}
+            return {"owned": True, "data": data, "hash": hashlib.blake2b(repr(data).encode(), digest_size=4).hexdigest()}
         raise ValueError("Data ownership validation failed")
     
     @staticmethod
     def cache_intelligent(key: str, data, ttl: int = 300):
-        """Essence cache!() - Cache intelligent en mémoire"""
-        if not hasattr(ILNEssences, '_cache'):
-            ILNEssences._cache = {}
-        
-        ILNEssences._cache[key] = {
+        """Essence cache!() - Cache intelligent en mémoire (LRU borné + TTL)"""
+        cache = ILNEssences._cache
+        cache[key] = {
             "data": data,
-            "timestamp": time.time(),
-            "ttl": ttl
+            "timestamp": time.monotonic_ns(),
+            "ttl": ttl * 1_000_000_000  # TTL en nanosecondes
         }
+        cache.move_to_end(key)
+        
+        # Éviction LRU au-delà de la capacité
+        while len(cache) > ILNEssences._cache_maxsize:
+            cache.popitem(last=False)
         return data
     
+    @staticmethod
+    def cache_trim():
+        """Purge des entrées expirées du cache!() en une passe"""
+        now = time.monotonic_ns()
+        cache = ILNEssences._cache
+        expired = [key for key, entry in cache.items()
+                   if now - entry["timestamp"] > entry["ttl"]]
+        for key in expired:
+            del cache[key]
+        return len(expired)
+    
     @staticmethod
     def ptr_optimize(operation):
         """Essence ptr!() - Optimisation mémoire directe"""
@@ -61,16 +130,20 @@ class PasswordDatabase:
     """Base de données en mémoire avec persistance"""
     
     def __init__(self):
-        self.passwords_history = []
+        self.passwords_history = deque(maxlen=10_000)  # Historique borné
         self.analytics = {
             "total_generated": 0,
-            "strength_distribution": {"weak": 0, "medium": 0, "strong": 0, "ultra": 0}
+            "strength_distribution": Counter({"weak": 0, "medium": 0, "strong": 0, "ultra": 0})
         }
     
     async def store_password_analytics(self, password_data):
-        """Stockage analytique avec essence chan!()"""
-        task = ILNEssences.chan_concurrent(self._store_async(password_data))
-        return await task
+        """Stockage analytique (lancé via chan!() par l'appelant)"""
+        return await self._store_async(password_data)
+    
+    async def store_batch_analytics(self, batch):
+        """Stockage analytique d'un lot de mots de passe"""
+        for password_data in batch:
+            await self._store_async(password_data)
     
     async def _store_async(self, password_data):
         """Stockage asynchrone réel"""
@@ -86,7 +159,7 @@ class PasswordDatabase:
         
         # Essence cache!() - Cache des statistiques
         return ILNEssences.cache_intelligent(
-            f"analytics_{time.time()}", 
+            "analytics_current", 
             self.analytics
         )
 
@@ -108,18 +181,28 @@ class PasswordEngine:
             length, include_symbols, include_numbers, include_uppercase
         ))
     
+    def generate_batch(self, count: int, length: int = 12, include_symbols: bool = True,
+                       include_numbers: bool = True, include_uppercase: bool = True):
+        """Génération groupée : tout le lot en une passe"""
+        passwords = _random_passwords(
+            count, length, include_symbols, include_numbers, include_uppercase
+        )
+        timestamp = time.time()
+        
+        return [
+            {
+                "password": password,
+                "strength": self._analyze_strength(password),
+                "length": length,
+                "timestamp": timestamp
+            }
+            for password in passwords
+        ]
+    
     def _generate_core(self, length, symbols, numbers, uppercase):
         """Coeur de génération optimisé"""
-        chars = string.ascii_lowercase
-        if uppercase:
-            chars += string.ascii_uppercase
-        if numbers:
-            chars += string.digits
-        if symbols:
-            chars += "!@#$%^&*()_+-=[]{}|;:,.<>?"
-        
-        # Génération sécurisée
-        password = ''.join(secrets.choice(chars) for _ in range(length))
+        # Génération sécurisée : un seul appel à l'entropie OS par tour
+        password = _random_passwords(1, length, symbols, numbers, uppercase)[0]
         
         # Analyse de force immédiate
         strength = self._analyze_strength(password)
@@ -131,27 +214,56 @@ class PasswordEngine:
             "timestamp": time.time()
         }
     
-    def _analyze_strength(self, password: str) -> str:
+    @staticmethod
+    def _analyze_strength(password: str) -> str:
         """Analyse de force en temps réel"""
         score = 0
         
         if len(password) >= 8: score += 1
-        if re.search(r'[a-z]', password): score += 1
-        if re.search(r'[A-Z]', password): score += 1
-        if re.search(r'\d', password): score += 1
-        if re.search(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]', password): score += 1
+        
+        # Une seule passe en C : translate() projette chaque octet sur sa
+        # classe, set() ne garde que les classes présentes (5 au plus)
+        mask = 0
+        for cls in set(password.encode().translate(_CLASS_LUT)):
+            mask |= cls
+        score += bin(mask).count('1')
+        
         if len(password) >= 12: score += 1
         
-        if score <= 2: return "weak"
-        elif score <= 3: return "medium"
-        elif score <= 4: return "strong"
-        else: return "ultra"
+        return _LEVELS[score]
 
 # ===============================================
 # API LAYER - Intégré au Backend
 # ===============================================
 
-app = FastAPI(title="ILN Password Generator", version="1.0.0")
+async def _cache_sweeper(interval: int = 60):
+    """Essence cache!() - Purge périodique des entrées expirées"""
+    while True:
+        await asyncio.sleep(interval)
+        ILNEssences.cache_trim()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Tâches de fond liées au cycle de vie du serveur"""
+    sweeper = asyncio.create_task(_cache_sweeper())
+    try:
+        yield
+    finally:
+        sweeper.cancel()
+        with suppress(asyncio.CancelledError):
+            await sweeper
+
+class _OrjsonResponse(JSONResponse):
+    """Essence ptr!() - JSON via orjson pour les routes sans response_model"""
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+app = FastAPI(
+    title="ILN Password Generator",
+    version="1.0.0",
+    lifespan=lifespan
+)
 
 # CORS pour le frontend
 app.add_middleware(
@@ -167,11 +279,16 @@ password_engine = PasswordEngine()
 
 # Models Pydantic
 class PasswordRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     length: int = 12
     include_symbols: bool = True
     include_numbers: bool = True
     include_uppercase: bool = True
 
+class PasswordBatchRequest(PasswordRequest):
+    count: int = 10
+
 class PasswordResponse(BaseModel):
     password: str
     strength: str
@@ -182,7 +299,7 @@ class PasswordResponse(BaseModel):
 # ENDPOINTS API
 # ===============================================
 
-@app.get("/")
+@app.get("/", response_class=_OrjsonResponse)
 async def root():
     """Health check"""
     return {"message": "ILN Password Generator Backend Active", "status": "operational"}
@@ -191,24 +308,47 @@ async def root():
 async def generate_password(request: PasswordRequest):
     """Génération de mot de passe avec essences ILN"""
     
-    # Essence chan!() - Traitement concurrent
-    generation_task = ILNEssences.chan_concurrent(
-        password_engine.generate_password(
-            request.length,
-            request.include_symbols,
-            request.include_numbers,
-            request.include_uppercase
-        )
+    # Génération synchrone : aucune tâche à planifier
+    result = password_engine.generate_password(
+        request.length,
+        request.include_symbols,
+        request.include_numbers,
+        request.include_uppercase
     )
     
-    result = await generation_task
+    # Essence chan!() - Stockage analytics en arrière-plan
+    ILNEssences.chan_concurrent(
+        password_engine.db.store_password_analytics(result)
+    )
     
-    # Stockage analytics en arrière-plan
-    await password_engine.db.store_password_analytics(result)
+    # Essence ptr!() - response_model sans response_class : FastAPI valide et
+    # encode directement en JSON via pydantic-core (dump_json), sans model_dump
+    return result
+
+@app.post("/generate_batch", response_model=List[PasswordResponse])
+async def generate_password_batch(request: PasswordBatchRequest):
+    """Génération groupée pour les appels en rafale"""
+    if not 1 <= request.count <= 1000:  # Sécurité
+        raise HTTPException(status_code=400, detail="Batch count must be between 1 and 1000")
+    if not 1 <= request.length <= 128:
+        raise HTTPException(status_code=400, detail="Batch length must be between 1 and 128")
     
-    return PasswordResponse(**result)
+    results = password_engine.generate_batch(
+        request.count,
+        request.length,
+        request.include_symbols,
+        request.include_numbers,
+        request.include_uppercase
+    )
+    
+    # Essence chan!() - Stockage analytics en arrière-plan
+    ILNEssences.chan_concurrent(
+        password_engine.db.store_batch_analytics(results)
+    )
+    
+    return results
 
-@app.get("/analytics")
+@app.get("/analytics", response_class=_OrjsonResponse)
 async def get_analytics():
     """Statistiques avec cache intelligent"""
     return ILNEssences.cache_intelligent(
@@ -217,7 +357,7 @@ async def get_analytics():
         ttl=60
     )
 
-@app.get("/strength/{password}")
+@app.get("/strength/{password}", response_class=_OrjsonResponse)
 async def analyze_strength(password: str):
     """Analyse de force d'un mot de passe existant"""
     if len(password) > 100:  # Sécurité
@@ -239,7 +379,7 @@ async def websocket_endpoint(websocket: WebSocket):
         while True:
             # Écoute des événements frontend
             data = await websocket.receive_text()
-            request_data = json.loads(data)
+            request_data = orjson.loads(data)
             
             if request_data["action"] == "generate":
                 # Génération temps réel
@@ -250,18 +390,26 @@ async def websocket_endpoint(websocket: WebSocket):
                     include_uppercase=request_data.get("uppercase", True)
                 )
                 
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(orjson.dumps({
                     "type": "password_generated",
                     "data": result
-                }))
+                }).decode())
                 
             elif request_data["action"] == "analyze":
                 # Analyse temps réel
-                strength = password_engine._analyze_strength(request_data["password"])
-                await websocket.send_text(json.dumps({
+                password = request_data["password"]
+                if len(password) > 100:  # Sécurité, comme /strength
+                    await websocket.send_text(orjson.dumps({
+                        "type": "error",
+                        "data": {"detail": "Password too long"}
+                    }).decode())
+                    continue
+                
+                strength = password_engine._analyze_strength(password)
+                await websocket.send_text(orjson.dumps({
                     "type": "strength_analyzed", 
                     "data": {"strength": strength}
-                }))
+                }).decode())
                 
     except Exception as e:
         print(f"WebSocket error: {e}")